@@ -1,9 +1,32 @@
+import functools
 import json
+import os
+import pickle
 import platform
+import sys
+from collections import Counter
+from typing import Iterable, NamedTuple, Optional, cast
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as json_loads
+    except ImportError:
+        json_loads = json.loads  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
 
 INVENTORY_LIMIT = 3
+INVENTORY_LOCATION = 999
 VERSION = "0.3.0.dev1"
-VALID_DIRECTIONS = ['north', 'east', 'south', 'west', 'up', 'down']
+# Bump whenever Item, Key, Room or MapData change in a way that makes
+# map data pickled by an older build unusable.
+MAP_CACHE_FORMAT = 1
+VALID_DIRECTIONS = frozenset(('north', 'east', 'south', 'west', 'up', 'down'))
 
 class Item:
     """
@@ -16,13 +39,22 @@ class Item:
             A brief description of the item.
         location: int
             The location of the item as a map index.
-            999 indicates it is in the player's inventory.
+            INVENTORY_LOCATION indicates it is in the player's inventory.
         is_held: bool
             Whether the item is held by the player or not.
         provides_light: bool
             Whether the item lights up rooms.
+        name_lower: str
+            The case-folded name, used to match player input.
+        is_key: bool
+            Whether the item is a Key. Set on the class, not per item.
     """
 
+    is_key = False
+
+    __slots__ = ("name", "description", "location", "is_held",
+                 "provides_light", "name_lower")
+
     def __init__(
             self, name: str, description: str, location: int,
             is_held: bool, provides_light: bool
@@ -32,19 +64,26 @@ class Item:
         self.location = location
         self.is_held = is_held
         self.provides_light = provides_light
+        self.name_lower = sys.intern(name.casefold())
 
 class Key(Item):
     """
     Create an object which represents a key.
 
     Attributes:
-        rooms: list[rooms] - A list of rooms the key can unlock as map indices.
+        rooms_unlocked: frozenset[int]
+            The rooms the key can unlock as map indices.
+            Empty if no rooms are given.
     """
 
+    is_key = True
+
+    __slots__ = ("rooms_unlocked",)
+
     def __init__(
             self, name: str, description: str, location: int,
             is_held: bool, provides_light: bool,
-            rooms_unlocked = list[int]
+            rooms_unlocked: Optional[Iterable[int]] = None
         ) -> None:
         Item.__init__(
             self,
@@ -54,7 +93,7 @@ class Key(Item):
             is_held,
             provides_light
         )
-        self.rooms_unlocked = rooms_unlocked
+        self.rooms_unlocked = frozenset(rooms_unlocked or ())
 
 
 class Room:
@@ -69,8 +108,14 @@ class Room:
         is_locked: bool - Whether the room is locked or not.
         exits (dict[str, int])
             A dictionary mapping directions to room numbers.
+        display_text: tuple[str, str]
+            The text shown before and after the room's items: the name
+            and description, then the formatted description of the exits.
     """
 
+    __slots__ = ("number", "name", "description", "is_lit", "is_locked",
+                 "exits", "display_text")
+
     def __init__(
             self, number: int, name: str, description: str,
             is_lit: bool, is_locked: bool, exits: dict[str, int]
@@ -81,109 +126,114 @@ class Room:
         self.is_lit = is_lit
         self.is_locked = is_locked
         self.exits = exits
+        self.display_text = (f"{name}\n{description}\n",
+                             format_passages(tuple(exits)) + "\n")
 
-def show_help() -> None:
-    """Shows help message, including version and system information."""
+class MapData(NamedTuple):
+    """
+    Holds everything loaded from a map file.
 
-    print(f"Version: {VERSION}")
-    print(f"OS: {platform.system()} {platform.release()} " +
-          f"{platform.version()}")
-    print(f"Python: {platform.python_version()} " +
-          f"({platform.python_branch()}:" +
-          f"{platform.python_revision()})")
+    Attributes:
+        rooms: dict[int, Room] - The rooms, keyed by room number.
+        items_by_location: dict[int, list[Item]]
+            Maps each room number to the items lying in that room.
+            Rooms without items have no entry.
+        items_by_name: dict[str, list[Item]]
+            Maps each case-folded item name to the items with that name.
+        movement: dict[tuple[int, str], int]
+            Maps (room number, direction) pairs to destination rooms.
+        metadata: dict[str, int]
+            Contains the data version, entrance and spawn room numbers.
+    """
 
-    print()
-    print("Enter the following commands to perform actions.")
-    print()
-    print("look - shows room name and description.")
-    print("go <direction: str> - travels in the specified direction.")
-    print("  Valid directions are 'north', 'south', 'east', 'west', " +
-          "'up', 'down'.")
-    print("pickup <item: str> - picks up the item.")
-    print("drop <item: str> - drops the item.")
-    print("inventory - shows inventory.")
-    print("leave - leaves house (only works at entrance).")
-    print("help - show this help message.")
-
-def check_key(room_number: int, items: list[Item]) -> bool:
-    """Checks if a key currently held by the player
-    can be used to unlock a room.
+    rooms: dict[int, Room]
+    items_by_location: dict[int, list[Item]]
+    items_by_name: dict[str, list[Item]]
+    movement: dict[tuple[int, str], int]
+    metadata: dict[str, int]
+
+@functools.lru_cache(maxsize=None)
+def get_help_text() -> str:
+    """Builds the help message, including version and system information.
+
+    The result is cached, as it cannot change while the game runs and
+    the platform queries can be slow."""
+
+    lines = [
+        f"Version: {VERSION}",
+        f"OS: {platform.system()} {platform.release()} " +
+        f"{platform.version()}",
+        f"Python: {platform.python_version()} " +
+        f"({platform.python_branch()}:" +
+        f"{platform.python_revision()})",
+        "",
+        "Enter the following commands to perform actions.",
+        "",
+        "look - shows room name and description.",
+        "go <direction: str> - travels in the specified direction.",
+        "  Valid directions are 'north', 'south', 'east', 'west', " +
+        "'up', 'down'.",
+        "pickup <item: str> - picks up the item.",
+        "drop <item: str> - drops the item.",
+        "inventory - shows inventory.",
+        "leave - leaves house (only works at entrance).",
+        "help - show this help message.",
+    ]
+    return "\n".join(lines) + "\n"
 
-    Parameters:
-    room_number: int
-      The room number the player is attempting to enter.
-    items: list[Item]
-      A list of all items.
+def show_help() -> None:
+    """Shows help message, including version and system information."""
 
-    Returns:
-    bool
-      True if the room can be unlocked, and False otherwise."""
-    for item in items:
-        if (isinstance(item, Key) and item.location == 999):
-            if room_number in item.rooms_unlocked:
-                return True
-    return False
-
-def format_passages(exits: dict[str, int]) -> str:
+    sys.stdout.write(get_help_text())
+
+@functools.lru_cache(maxsize=None)
+def format_passages(directions: tuple[str, ...]) -> str:
     """Formats exits out of a room.
 
+    Results are cached, as rooms often share the same exit directions.
+
     Parameters:
-    exits: dict[str, int]
-      The exits out of a room with direction and destination room
-      expressed as a map index.
+    directions: tuple[str, ...]
+      The directions of the exits out of a room.
 
     Returns:
     str
       The formatted string representing the exits from the room."""
 
-    if not exits:
+    if not directions:
         return "There are no visible exits from the room."
 
-    directions = []
-    for direction in exits:
-        directions.append(direction)
-
     if len(directions) == 1:
         return f"There is a passage out of the room going {directions[0]}."
-    elif len(directions) == 2:
-        return f"There are passages out of the room going {directions[0]} and {directions[1]}."
-    else:
-        all_but_last = ", ".join(directions[:-1])
-        return f"There are passages out of the room going {all_but_last} and {directions[-1]}."
+
+    *all_but_last, last = directions
+    return ("There are passages out of the room going " +
+            f"{', '.join(all_but_last)} and {last}.")
 
 def get_new_room_number(
-        game_map: dict, current_room_num: int,
+        movement: dict[tuple[int, str], int], current_room_num: int,
         direction: str
-    ) -> int:
+    ) -> Optional[int]:
     """Gets the new room number in the specified direction.
 
+    This is a single lookup in the movement table and prints nothing;
+    the caller reports invalid or blocked moves.
+
     Parameters:
-    game_map: dict
-      The game map (excluding items).
+    movement: dict[tuple[int, str], int]
+      Maps (room number, direction) pairs to destination room numbers.
     current_room_num: int
       The current room as a map index.
     direction: str
-      The direction of travel specified by the player.
+      The direction of travel specified by the player, in lowercase.
 
     Returns:
-    int
+    Optional[int]
       The new room number.
-      Returns -1 if the direction is invalid.
+      Returns None if there is no exit in that direction.
     """
 
-    direction = direction.lower()
-
-    if direction not in VALID_DIRECTIONS:
-        print(f"'{direction}' is not a valid direction.")
-        return -1
-
-    current_room = game_map[current_room_num]
-
-    if direction in current_room.exits:
-        return current_room.exits[direction]
-    else:
-        print(f"You can't go {direction} from here.")
-        return -1
+    return movement.get((current_room_num, direction))
 
 
 def create_item(location: int, item_data: dict) -> Item:
@@ -214,31 +264,30 @@ def create_item(location: int, item_data: dict) -> Item:
             location=location,
             is_held=item_data["is_held"],
             provides_light=item_data["provides_light"],
-            rooms_unlocked=item_data.get("rooms_unlocked", [])
+            rooms_unlocked=item_data.get("rooms_unlocked")
         )
     else:
         raise ValueError(f"Unknown item type: {item_data['type']}")
 
-def get_map_data(mapfile: str) -> tuple:
+def create_map_data(data: dict, room_datas: Iterable[dict]) -> MapData:
     """
-    Loads map data from a JSON file.
+    Creates map data from the contents of a map file.
 
     Parameters:
-    mapfile: str
-    The file to load the map data from.
+    data: dict
+      The top-level fields of the map file, including the metadata.
+    room_datas: Iterable[dict]
+      The data of each room as read from the map file.
 
     Returns:
-    tuple
-        Contains two lists: rooms and metadata.
-        rooms: list[Room] - contains the map data.
-        metadata: dict[str, str] - contains the entrance room number.
+    MapData
+        The rooms, item indexes, movement table and metadata of the map.
     """
-    with open(mapfile, 'r') as f:
-        data = json.load(f)
-
     valid_data_versions = [2]
-    rooms = []
-    items = []
+    rooms: dict[int, Room] = {}
+    items_by_location: dict[int, list[Item]] = {}
+    items_by_name: dict[str, list[Item]] = {}
+    movement: dict[tuple[int, str], int] = {}
     metadata = {"data_version": data['data_version'],
                 "entrance_room": data['entrance_room'],
                 "spawn_room": data['spawn_room']}
@@ -248,22 +297,152 @@ def get_map_data(mapfile: str) -> tuple:
         input("Press [Enter] to quit")
         quit()
 
-    for room_data in data['room_data']:
+    for room_data in room_datas:
         room = Room(
             number=room_data['number'],
             name=room_data['name'],
             description=room_data['description'],
             is_lit=room_data['lit'],
             is_locked=room_data['locked'],
-            exits=room_data['exits']
+            exits={sys.intern(direction): new_room_num
+                   for direction, new_room_num
+                   in room_data['exits'].items()}
         )
-        rooms.append(room)
+        rooms[room.number] = room
+
+        for direction, new_room_num in room.exits.items():
+            movement[(room.number, direction)] = new_room_num
 
         for item_data in room_data.get("items", []):
             item = create_item(room_data['number'], item_data)
-            items.append(item)
+            items_by_location.setdefault(item.location, []).append(item)
+            items_by_name.setdefault(item.name_lower, []).append(item)
+
+    return MapData(rooms, items_by_location, items_by_name,
+                   movement, metadata)
+
+def get_map_data(mapfile: str) -> MapData:
+    """
+    Loads map data from a JSON file.
+
+    If ijson is available the rooms are parsed one at a time, so the
+    whole document is never held in memory at once. This uses less
+    memory on large maps but loads more slowly than parsing the file
+    in one go.
+
+    Parameters:
+    mapfile: str
+    The file to load the map data from.
+
+    Returns:
+    MapData
+        The rooms, item indexes, movement table and metadata of the map.
+    """
+    with open(mapfile, 'rb') as f:
+        if ijson is None:
+            data = json_loads(f.read())
+            return create_map_data(data, data['room_data'])
+
+        # Map files list the metadata before room_data, so reading parser
+        # events stops as soon as all of it is found. The rooms are then
+        # streamed in a second pass. A map listing metadata after
+        # room_data is scanned to the end here instead.
+        metadata_keys = ("data_version", "entrance_room", "spawn_room")
+        scalar_events = ("number", "string", "boolean", "null")
+        data = {}
+        for prefix, event, value in ijson.parse(f):
+            if event in scalar_events and prefix in metadata_keys:
+                data[prefix] = value
+                if len(data) == len(metadata_keys):
+                    break
+        f.seek(0)
+        return create_map_data(data, ijson.items(f, 'room_data.item'))
+
+def intern_map_data(map_data: MapData) -> MapData:
+    """
+    Interns the direction and item name strings of unpickled map data.
+
+    Unpickling does not keep strings interned, so the exits, movement
+    table and item name index are rebuilt with interned keys.
+
+    Parameters:
+    map_data: MapData
+    The map data loaded from a pickle.
+
+    Returns:
+    MapData
+        The same map data with its direction and name keys interned.
+    """
+    movement = map_data.movement
+    movement.clear()
+    for room in map_data.rooms.values():
+        room.exits = {sys.intern(direction): new_room_num
+                      for direction, new_room_num in room.exits.items()}
+        for direction, new_room_num in room.exits.items():
+            movement[(room.number, direction)] = new_room_num
+
+    items_by_name: dict[str, list[Item]] = {}
+    for name_lower, items in map_data.items_by_name.items():
+        name_lower = sys.intern(name_lower)
+        for item in items:
+            item.name_lower = name_lower
+        items_by_name[name_lower] = items
+
+    return map_data._replace(items_by_name=items_by_name)
+
+def load_map_data(mapfile: str) -> MapData:
+    """
+    Loads map data, reusing a pickled copy of a previous load if possible.
+
+    The pickle is stored next to the map file with a .pkl extension.
+    It is only used if it is at least as new as the map file and its
+    header matches this build: the same MAP_CACHE_FORMAT and VERSION,
+    and the same attributes on Item, Key, Room and MapData. Strings are
+    interned again after loading it, see intern_map_data. Otherwise
+    the map file is parsed with get_map_data and the pickle is
+    rewritten.
 
-    return rooms, items, metadata
+    Loading a pickle can run arbitrary code, so the cache file is
+    trusted like the game's own code. Never place a .pkl file from
+    elsewhere next to a map.
+
+    Parameters:
+    mapfile: str
+    The file to load the map data from.
+
+    Returns:
+    MapData
+        The rooms, item indexes, movement table and metadata of the map.
+    """
+    cachefile = os.path.splitext(mapfile)[0] + ".pkl"
+    # Classes compiled by mypyc have no __slots__, only __mypyc_attrs__,
+    # which also keeps compiled and interpreted caches apart.
+    layouts = tuple(getattr(cls, "__slots__", None)
+                    or getattr(cls, "__mypyc_attrs__", ())
+                    for cls in (Item, Key, Room))
+    header = (MAP_CACHE_FORMAT, VERSION, layouts, MapData._fields)
+
+    try:
+        if os.path.getmtime(cachefile) >= os.path.getmtime(mapfile):
+            with open(cachefile, 'rb') as f:
+                if pickle.load(f) == header:
+                    map_data = pickle.load(f)
+                    if isinstance(map_data, MapData):
+                        return intern_map_data(map_data)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # A missing, stale or corrupt cache just means parsing the map.
+        pass
+
+    map_data = get_map_data(mapfile)
+
+    try:
+        with open(cachefile, 'wb') as f:
+            pickle.dump(header, f, protocol=5)
+            pickle.dump(map_data, f, protocol=5)
+    except OSError:
+        pass
+
+    return map_data
 
 def main() -> None:
     """Runs the main game loop.
@@ -271,11 +450,12 @@ def main() -> None:
     The game loop is structured as follows:
     1. Describe the room, if it is lit.
     2. Input a command.
-    3. Execute the command.
+    3. Execute the command by dispatching to its handler.
       a. If the command is 'go' (supplied with a valid direction),
          check if the room is unlocked.
          If the room is locked, check if the player can unlock it
-         using a key present in their inventory.
+         using a key present in their inventory, tracked by counting
+         the held keys that unlock each room.
          If either are true, change the room number.
       b. If the command is 'leave', check if the player
          is at the entrance room and can leave.
@@ -285,43 +465,42 @@ def main() -> None:
     print("Welcome. Type 'help' for help.")
     print()
 
-    game_map, items, metadata = get_map_data("map.json")
+    (game_map, items_by_location, items_by_name,
+     movement, metadata) = load_map_data("map.json")
     leave = False
     current_room = metadata['spawn_room']
+    room = game_map[current_room]
     entrance_room = metadata['entrance_room']
-    items_held = 0
+    inventory: list[Item] = []
+    light_sources_held = 0
+    unlocked_rooms: Counter[int] = Counter()
 
-    def describe_room() -> None:
+    def describe_room(room: Room) -> None:
         """Checks if the room is lit.
         If it is, prints room name and description.
         Also prints ways out of the room."""
 
-        player_light = any(item.provides_light
-                           and item.location == 999 for item in items)
-        if not game_map[current_room].is_lit and not player_light:
+        if not room.is_lit and not light_sources_held:
             print("This is a dark room. You can't see anything.")
         else:
-            print(game_map[current_room].name)
-            print(game_map[current_room].description)
-
-            for item in items:
-                if item.location == current_room:
-                    print(f"There is a {item.name} here.")
-
-            print(format_passages(game_map[current_room].exits))
+            heading, passages = room.display_text
+            parts = [heading]
+            room_items = items_by_location.get(room.number)
+            if room_items:
+                parts.extend(f"There is a {item.name} here.\n"
+                             for item in room_items)
+            parts.append(passages)
+            sys.stdout.write("".join(parts))
 
     def show_inventory() -> None:
         """Displays items in the player's inventory."""
 
-        is_carrying_nothing = True
-        print("You are carrying:")
-        for item in items:
-            if item.location == 999:
-                print(f"- {item.name}")
-                is_carrying_nothing = False
-        if is_carrying_nothing:
-            print("Nothing")
-        print()
+        parts = ["You are carrying:\n"]
+        parts.extend(f"- {item.name}\n" for item in inventory)
+        if not inventory:
+            parts.append("Nothing\n")
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
 
     def validate_exit() -> bool:
         """Checks if 'Aura' is present in the player's inventory,
@@ -330,103 +509,158 @@ def main() -> None:
         bool
             True if 'Aura' is present, and False otherwise."""
 
-        return any(item.name == "Aura"
-                   and item.location == 999 for item in items)
+        return any(item.name == "Aura" and item.location == INVENTORY_LOCATION
+                   for item in items_by_name.get("aura", ()))
+
+    def do_look(_arg: str) -> None:
+        """Handles the 'look' command."""
+
+        describe_room(room)
+
+    def do_inventory(_arg: str) -> None:
+        """Handles the 'inventory' command."""
+
+        show_inventory()
+
+    def do_pickup(arg: str) -> None:
+        """Handles the 'pickup' command."""
+
+        nonlocal light_sources_held, unlocked_rooms
+
+        if not arg:
+            print("Pickup what?")
+            return
+        item = next((item for item in items_by_name.get(arg, ())
+                     if item.location == current_room), None)
+        if item is None:
+            print("No such item here.")
+            print("Hint: Enter the full name of the item, " +
+                  "eg. 'rusty key' instead of 'key'.")
+            return
+        if len(inventory) >= INVENTORY_LIMIT:
+            print("You're carrying too much. " +
+                  "Drop an item to pick it up.")
+            return
+
+        room_items = items_by_location[current_room]
+        room_items.remove(item)
+        if not room_items:
+            del items_by_location[current_room]
+        inventory.append(item)
+        item.location = INVENTORY_LOCATION
+        if item.provides_light:
+            light_sources_held += 1
+        if item.is_key:
+            unlocked_rooms += Counter(cast(Key, item).rooms_unlocked)
+        print(f"You picked up the {item.name}.")
+
+    def do_drop(arg: str) -> None:
+        """Handles the 'drop' command."""
+
+        nonlocal light_sources_held, unlocked_rooms
+
+        if not arg:
+            print("Drop what?")
+            return
+        item = next((item for item in items_by_name.get(arg, ())
+                     if item.location == INVENTORY_LOCATION), None)
+        if item is None:
+            print("You're not carrying that.")
+            return
+
+        inventory.remove(item)
+        items_by_location.setdefault(current_room, []).append(item)
+        item.location = current_room
+        if item.provides_light:
+            light_sources_held -= 1
+        if item.is_key:
+            unlocked_rooms -= Counter(cast(Key, item).rooms_unlocked)
+        print(f"You dropped the {item.name}.")
+
+    def do_go(arg: str) -> None:
+        """Handles the 'go' command."""
+
+        nonlocal current_room, room
+
+        if not arg:
+            print("Go where?")
+            return
+
+        direction, _, _ = arg.partition(" ")
+        if direction not in VALID_DIRECTIONS:
+            print(f"'{direction}' is not a valid direction.")
+            return
+
+        # Only known directions are interned, not arbitrary input.
+        direction = sys.intern(direction)
+        new_room_number = get_new_room_number(
+            movement,
+            current_room,
+            direction
+        )
 
-    describe_room()
+        if new_room_number is None:
+            print(f"You can't go {direction} from here.")
+            return
+
+        new_room = game_map[new_room_number]
+        if new_room.is_locked and not unlocked_rooms[new_room_number]:
+            print("This room is locked. You need a key.")
+            return
+
+        current_room = new_room_number
+        room = new_room
+        describe_room(room)
+
+        if current_room == entrance_room:
+            print("You have reached the entrance. " +
+                  "Type 'leave' to exit.")
+
+    def do_leave(_arg: str) -> None:
+        """Handles the 'leave' command."""
+
+        nonlocal leave
+
+        if current_room == entrance_room:
+            if validate_exit():
+                leave = True
+            else:
+                print("You don't have enough aura to leave! " +
+                      "Press Ctrl-C to force quit and lose.")
+        else:
+            print("You can't leave from here.")
+
+    def do_help(_arg: str) -> None:
+        """Handles the 'help' command."""
+
+        show_help()
+
+    commands = {
+        "look": do_look,
+        "inventory": do_inventory,
+        "pickup": do_pickup,
+        "drop": do_drop,
+        "go": do_go,
+        "leave": do_leave,
+        "help": do_help,
+    }
+
+    describe_room(room)
 
     while not leave:
-        command = input("> ").strip().lower().split()
+        command = input("> ").casefold().split()
 
         if not command:
             print("Enter 'help' for help.")
             continue
 
-        if command[0] == "look":
-            describe_room()
-
-        elif command[0] == "inventory":
-            show_inventory()
-
-        elif command[0] == "pickup":
-            if len(command) < 2:
-                print("Pickup what?")
-                continue
-            item_name = " ".join(command[1:])
-            for item in items:
-                if (item.location == current_room
-                    and item.name.lower() == item_name):
-                    if items_held < INVENTORY_LIMIT:
-                        item.location = 999
-                        items_held += 1
-                        print(f"You picked up the {item.name}.")
-                    else:
-                        print("You're carrying too much. " +
-                              "Drop an item to pick it up.")
-                    break
-            else:
-                print("No such item here.")
-                print("Hint: Enter the full name of the item, " +
-                      "eg. 'rusty key' instead of 'key'.")
-
-        elif command[0] == "drop":
-            if len(command) < 2:
-                print("Drop what?")
-                continue
-            item_name = " ".join(command[1:])
-            for item in items:
-                if (item.location == 999
-                    and item.name.lower() == item_name):
-                    item.location = current_room
-                    items_held -= 1
-                    print(f"You dropped the {item.name}.")
-                    break
-            else:
-                print("You're not carrying that.")
-
-        elif command[0] == "go":
-            if len(command) < 2:
-                print("Go where?")
-                continue
-
-            direction = command[1]
-            new_room_number = get_new_room_number(
-                game_map,
-                current_room,
-                direction
-            )
-
-            if new_room_number == -1:
-                continue
-
-            if (game_map[new_room_number].is_locked
-                and not check_key(new_room_number, items)):
-                print("This room is locked. You need a key.")
-                continue
-
-            current_room = new_room_number
-            describe_room()
-
-            if current_room == entrance_room:
-                print("You have reached the entrance. " +
-                      "Type 'leave' to exit.")
-
-        elif command[0] == "leave":
-            if current_room == entrance_room:
-                if validate_exit():
-                    leave = True
-                    break
-                else:
-                    print("You don't have enough aura to leave! " +
-                          "Press Ctrl-C to force quit and lose.")
-            else:
-                print("You can't leave from here.")
-
-        elif command[0] == "help":
-            show_help()
-
-        else:
+        verb, *args = command
+        handler = commands.get(verb)
+        if handler is None:
             print("Unknown command. Enter 'help' for commands.")
+            continue
+        # Only multi-word arguments need joining; no args join to "".
+        handler(args[0] if len(args) == 1 else " ".join(args))
 
     print("The door opens, revealing the night sky outside.")
     print("You have escaped.")